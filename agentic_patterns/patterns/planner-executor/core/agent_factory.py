@@ -2,17 +2,31 @@
 # Central factory for creating and caching agents defined in the YAML configuration
 
 
+import asyncio
+import logging
 import os
-from datetime import datetime
+import time
+from datetime import date
+from functools import lru_cache
 from agents import Agent, ModelSettings
 
 from core.config_loader import AgentConfigLoader
 from core.registries import tool_registry, output_type_registry
 
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _today_str(day_ordinal: int) -> str:
+    """Format today's date once per day; the ordinal key rolls the cache at midnight."""
+    return date.fromordinal(day_ordinal).isoformat()
+
+
 class AgentFactory:
     _agents = {}  # Cache of instantiated agents to enforce singleton behavior
     _config_loader = AgentConfigLoader()  # Loads YAML agent configurations
+    _resolved_tools = {}  # Memoized tool lists per agent type, resolved once from the registry
 
     @classmethod
     def get_agent(cls, agent_type: str, from_cache: bool = True) -> Agent:
@@ -21,7 +35,7 @@ class AgentFactory:
         """
         # Return cached agent if already created
         if from_cache and agent_type in cls._agents:
-            print(f"- Retrieving {agent_type} agent from cache.")
+            log.debug("Retrieving %s agent from cache.", agent_type)
             return cls._agents[agent_type]
 
         # Create a new agent instance
@@ -30,11 +44,21 @@ class AgentFactory:
         # Store instance in cache and return it
         if from_cache:
             cls._agents[agent_type] = agent
-            print(f"- Cached {agent_type} agent.")
+            log.debug("Cached %s agent.", agent_type)
 
         return agent
 
     
+    @classmethod
+    async def warmup(cls, agent_types: tuple = ('planner', 'consolidator', 'worker')):
+        """
+        Pre-build and cache the given agents concurrently, off the event-loop thread,
+        so the first query does not pay for agent construction.
+        """
+        await asyncio.gather(
+            *(asyncio.to_thread(cls.get_agent, agent_type) for agent_type in agent_types)
+        )
+
     @classmethod
     def _create_agent(cls, agent_type: str) -> Agent:
         """
@@ -44,9 +68,8 @@ class AgentFactory:
         # Load agent configuration from YAML
         agent_config = cls._config_loader.get_agent_config(agent_type)
 
-        # Unique timestamp for naming
-        now_string = datetime.now().strftime("%Y-%m-%dT%H:%M:%SU%s")
-        agent_name = agent_config.get('name') or f"{agent_type}_{now_string}"
+        # Unique fallback name when the config provides none; time_ns needs no strftime
+        agent_name = agent_config.get('name') or f"{agent_type}_{time.time_ns()}"
 
         # Build model settings from config
         model_settings = ModelSettings(
@@ -54,11 +77,14 @@ class AgentFactory:
             max_tokens=agent_config.get('max_tokens'),
         )
 
-        # Resolve tools from registry
-        tool_names = agent_config.get('tools', [])
-        resolved_tools = [
-            tool_registry.get(name) or cls._raise_tool_error(name, agent_type) for name in tool_names
-        ]
+        # Resolve tools from registry (memoized: registry contents do not change at runtime)
+        resolved_tools = cls._resolved_tools.get(agent_type)
+        if resolved_tools is None:
+            tool_names = agent_config.get('tools', [])
+            resolved_tools = [
+                tool_registry.get(name) or cls._raise_tool_error(name, agent_type) for name in tool_names
+            ]
+            cls._resolved_tools[agent_type] = resolved_tools
 
         # Resolve output type
         output_type = output_type_registry.get(agent_config.get('output_type'))
@@ -67,7 +93,7 @@ class AgentFactory:
         instructions = agent_config.get('instructions')
         if not instructions:
             raise ValueError(f"No instructions provided for agent type '{agent_type}'.")
-        dated_instructions = f"Today is {datetime.now().strftime('%Y-%m-%d')}\n\n{instructions}"
+        dated_instructions = f"Today is {_today_str(date.today().toordinal())}\n\n{instructions}"
 
         # Create agent
         agent = Agent(
@@ -79,7 +105,7 @@ class AgentFactory:
             model_settings=model_settings
         )
 
-        print(f"Created a new {agent_type} agent.")
+        log.info("Created a new %s agent.", agent_type)
         return agent
 
     @staticmethod
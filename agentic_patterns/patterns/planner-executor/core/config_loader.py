@@ -2,9 +2,25 @@
 # Load the agents-config.yaml file
 
 import yaml
-import json
+from functools import lru_cache
 from pathlib import Path
 
+# Prefer the C-accelerated loader when libyaml is available
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str) -> dict:
+    """Parse a YAML file and memoize the result, keyed by resolved path."""
+    config_path = Path(path)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+    with config_path.open('r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 
 class AgentConfigLoader:
     def __init__(self, config_path: str = './config/agents-config.yaml'):
@@ -12,13 +28,14 @@ class AgentConfigLoader:
         self.data = self._load()
 
     def _load(self) -> dict:
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
-        with self.config_path.open('r') as file:
-            return yaml.safe_load(file)
+        return _load_yaml(str(self.config_path.resolve()))
 
     def get_agent_config(self, agent_type: str) -> dict:
         if agent_type not in self.data:
             raise ValueError(f"Agent type '{agent_type}' not found in config.")
         return self.data[agent_type]
 
+    @classmethod
+    def reload(cls):
+        """Clear the memoized YAML so the next loader re-reads the file from disk."""
+        _load_yaml.cache_clear()
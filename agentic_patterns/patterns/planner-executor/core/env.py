@@ -1,13 +1,42 @@
 # core/env.py
 from dotenv import load_dotenv
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+
+# Listener thread that performs the actual log I/O, started once per process
+_log_listener: logging.handlers.QueueListener = None
+
+
+def _configure_logging():
+    """Route log records through a queue so handler I/O happens off the event loop."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("CONF_LOG_LEVEL", "INFO").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 
 def load_environment():
     """Load environment variables from a .env file and return key settings."""
     load_dotenv(override=True)
+    _configure_logging()
     return {
         "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
         "SERPER_API_KEY": os.getenv("SERPER_API_KEY"),
-        
+
         "DEFAULT_MODEL": os.getenv("CONF_OPENAI_DEFAULT_MODEL"),
-    }
\ No newline at end of file
+        "MAX_CONCURRENCY": int(os.getenv("CONF_MAX_CONCURRENCY", "16")),
+    }
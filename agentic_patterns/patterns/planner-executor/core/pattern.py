@@ -2,16 +2,186 @@
 # Coordinates execution of the Planner–Executor pattern from a single interface.
 
 import asyncio
-import json
+import logging
+import orjson
+import os
+import random
+import re
+from functools import lru_cache
 from agents import Runner, trace
 from agents.exceptions import MaxTurnsExceeded
-from collections import defaultdict
-from typing import Set
+from openai import RateLimitError
+from typing import List, Set, Tuple
 
 from core.agent_factory import AgentFactory
+from core.plan_cache import PlanCache
+from core.task_cache import TaskCache
 from schema.executor import ExecutorResponse
 from schema.orchestrator import OrchestratorResponse, TaskOutput
-from schema.planner import TasksPlan
+from schema.planner import PlannerTask, TasksPlan
+
+
+log = logging.getLogger(__name__)
+
+
+# Shared cache instances, created lazily on first use
+_plan_cache: PlanCache = None
+_task_cache: TaskCache = None
+
+
+def _get_plan_cache() -> PlanCache:
+    global _plan_cache
+    if _plan_cache is None and PlanCache.enabled():
+        _plan_cache = PlanCache()
+    return _plan_cache
+
+
+def _get_task_cache() -> TaskCache:
+    global _task_cache
+    if _task_cache is None:
+        _task_cache = TaskCache()
+    return _task_cache
+
+
+# Global cap on concurrent OpenAI calls, shared by the planner, consolidator, and all
+# workers, so a wide plan cannot fan out past the account's useful parallelism. Created
+# lazily so LLM_MAX_CONCURRENCY is read after load_environment has loaded the .env file.
+_llm_sema: asyncio.Semaphore = None
+_LLM_RETRY_ATTEMPTS = 5
+
+
+def _get_llm_sema() -> asyncio.Semaphore:
+    global _llm_sema
+    if _llm_sema is None:
+        _llm_sema = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "20")))
+    return _llm_sema
+
+
+@lru_cache(maxsize=1)
+def _worker_agent():
+    """Resolve the shared Worker agent once per process instead of per task."""
+    return AgentFactory.get_agent('worker')
+
+
+async def _run_with_retry(agent, input: str):
+    """
+    Run an agent under the global LLM concurrency cap, retrying rate-limit errors
+    with exponential backoff and jitter.
+    """
+    for attempt in range(1, _LLM_RETRY_ATTEMPTS + 1):
+        try:
+            async with _get_llm_sema():
+                return await Runner.run(agent, input)
+        except RateLimitError:
+            if attempt == _LLM_RETRY_ATTEMPTS:
+                raise
+            await asyncio.sleep(min(30.0, 2 ** (attempt - 1) + random.random()))
+
+
+# Progress queues are bounded so a slow (or absent) consumer cannot grow them without limit
+_PROGRESS_QUEUE_MAXSIZE = 256
+
+# Minimum number of streamed output characters between worker heartbeat reports
+_STREAM_REPORT_CHARS = 2048
+
+
+def _report(pq: asyncio.Queue, msg: str):
+    """
+    Post a progress message without letting reporting stall orchestration.
+
+    When the queue is full the oldest message is dropped to make room. The internal
+    throwaway queues rely on this drop path, since nothing ever consumes them.
+    """
+    try:
+        pq.put_nowait(msg)
+    except asyncio.QueueFull:
+        try:
+            pq.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        try:
+            pq.put_nowait(msg)
+        except asyncio.QueueFull:
+            pass
+
+
+def _dump_plan_pretty(plan: "TasksPlan") -> str:
+    """Render a plan as indented JSON for progress reporting."""
+    return orjson.dumps(plan.model_dump(), option=orjson.OPT_INDENT_2).decode()
+
+
+# Derived dependency graphs keyed by plan structure (task ids + input edges), so a
+# recurring plan shape — common once plans are cached — skips the setup pass and only
+# rebuilds the per-run mutable state. Bounded: the oldest shape is evicted once full,
+# so distinct plan shapes cannot grow the cache for the life of the process.
+_GRAPH_CACHE: dict = {}
+_GRAPH_CACHE_MAXSIZE = 128
+
+
+def _graph_key(task_plan: TasksPlan) -> tuple:
+    # The structure tuple itself is the key; hashing it down to an int would let a
+    # hash collision between two plan shapes silently reuse the wrong graph
+    return tuple(sorted((t.id, tuple(sorted(t.inputs))) for t in task_plan.plan))
+
+
+# Matches the opening of the "plan" array in the Planner's streamed JSON output
+_PLAN_ARRAY_RE = re.compile(r'"plan"\s*:\s*\[')
+
+# Recovers the task id from the known prefix of a worker prompt
+_TASK_ID_RE = re.compile(r"Task ID:\s*(\S+)")
+
+
+def _extract_complete_objects(buffer: str, pos: int) -> Tuple[List[str], int]:
+    """
+    Scan `buffer` from `pos` for complete top-level JSON objects inside an array.
+
+    Returns the list of complete object strings found and the position where the
+    scan should resume once more of the stream has arrived. Objects that are only
+    partially present are left for the next scan.
+    """
+    objects = []
+    length = len(buffer)
+
+    while pos < length:
+        char = buffer[pos]
+        if char in ' \t\r\n,':
+            pos += 1
+            continue
+        if char == ']':
+            break
+        if char != '{':
+            # Malformed or unexpected content; let final validation deal with it
+            break
+
+        # Walk to the matching closing brace, ignoring braces inside strings
+        depth, in_string, escaped = 0, False, False
+        end = -1
+        for i in range(pos, length):
+            c = buffer[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == '\\':
+                    escaped = True
+                elif c == '"':
+                    in_string = False
+            elif c == '"':
+                in_string = True
+            elif c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+
+        if end < 0:
+            # Object not yet complete in the stream
+            break
+        objects.append(buffer[pos:end + 1])
+        pos = end + 1
+
+    return objects, pos
 
 
 class PlannerExecutorPattern:
@@ -37,145 +207,400 @@ class PlannerExecutorPattern:
         """
 
         # Initialize pq with a throwaway queue if none was provided or use progress_report
-        pq = asyncio.Queue() if progress_report is None else progress_report
+        pq = asyncio.Queue(maxsize=_PROGRESS_QUEUE_MAXSIZE) if progress_report is None else progress_report
 
         planner = AgentFactory.get_agent("planner")
         consolidator = AgentFactory.get_agent("consolidator")
 
-        # Step 1: Use Planner to generate a plan
-        with trace(planner.name):
-            await pq.put(f"Running {planner.name}...\n")
-            planner_result = await Runner.run(planner, f"User Goal: {query}")
-
-        if planner_result is None or not planner_result.final_output:
-            await pq.put(f" - {planner.name}: failed to produce a plan\n")
-            raise ValueError("Planner agent failed to produce a valid plan.")
+        # Step 0: Check the plan cache for a prior plan that matches this query
+        plan_cache = _get_plan_cache()
+        plan = None
+        if plan_cache is not None:
+            plan = await plan_cache.lookup(query)
+            if plan is not None:
+                _report(pq, f" - plan cache: reusing a cached TasksPlan, skipping {planner.name}\n")
+
+        # Steps 1 and 2: Generate the plan and orchestrate its tasks. When the Planner
+        # runs, it streams: tasks are dispatched as soon as they appear in the stream so
+        # dependency-free work overlaps with the rest of planning. A cached plan is
+        # already complete, so it is orchestrated in one shot.
+        _report(pq, f"Orchastrating tasks...\n")
+        if plan is None:
+            task_feed = asyncio.Queue()
+            orchestration = asyncio.create_task(
+                PlannerExecutorPattern._orchestrate_tasks(task_feed=task_feed, progress_report=pq)
+            )
 
-        plan = planner_result.final_output_as(TasksPlan)
-        await pq.put(f" - {planner.name}: returned a TasksPlan\n```json\n{plan.model_dump_json(indent=2)}\n```\n")
+            with trace(planner.name):
+                _report(pq, f"Running {planner.name}...\n")
+                try:
+                    plan = await PlannerExecutorPattern._stream_plan(planner, query, task_feed, pq)
+                except Exception:
+                    orchestration.cancel()
+                    raise
 
-        # Step 2: Execute the plan and consolidate the results
-        with trace(consolidator.name):
-            await pq.put(f"Orchastrating tasks...\n")
+            _report(pq, f" - {planner.name}: returned a TasksPlan\n```json\n{_dump_plan_pretty(plan)}\n```\n")
+            ochestrator_result = await orchestration
+        else:
+            _report(pq, f" - {planner.name}: returned a TasksPlan\n```json\n{_dump_plan_pretty(plan)}\n```\n")
             ochestrator_result = await PlannerExecutorPattern._orchestrate_tasks(plan, progress_report=pq)
 
-            await pq.put(f" - orchastration of tasks plan complete\n")
-            consolidation_dict = {'tasks_plan': plan.model_dump(), 'tasks_output': ochestrator_result.model_dump()}
-            consolidation_str = json.dumps(consolidation_dict)
+        # A single dependency-free task needs no consolidation — its output already is
+        # the answer — so skip the Consolidator round-trip entirely
+        if len(plan.plan) == 1 and not plan.plan[0].inputs:
+            task_output = ochestrator_result.tasks_executed.get(plan.plan[0].id)
+            if task_output is not None and task_output.output:
+                _report(pq, f"- single-task plan: skipping {consolidator.name}\n")
+                if plan_cache is not None:
+                    await plan_cache.store(query, plan)
+                return ExecutorResponse(
+                    status="success" if not task_output.errors else "partial",
+                    final_output=task_output.output,
+                    reasoning=task_output.errors
+                )
+
+        # Step 3: Consolidate the results
+        with trace(consolidator.name):
+            _report(pq, f" - orchastration of tasks plan complete\n")
+            # Splice the models' own JSON together rather than materializing the plan and
+            # outputs as dicts only to re-encode them
+            consolidation_str = (
+                f'{{"tasks_plan":{plan.model_dump_json()},'
+                f'"tasks_output":{ochestrator_result.model_dump_json()}}}'
+            )
 
-            await pq.put(f"Running {consolidator.name}...\n")
-            consolidator_result = await Runner.run(consolidator, consolidation_str)
+            _report(pq, f"Running {consolidator.name}...\n")
+            consolidator_result = await _run_with_retry(consolidator, consolidation_str)
 
         if consolidator_result and consolidator_result.final_output:
-            await pq.put(f"- {consolidator.name} returned a valid response\n")
+            _report(pq, f"- {consolidator.name} returned a valid response\n")
+
+            # Remember the plan only after it has led to a valid end-to-end response
+            if plan_cache is not None:
+                await plan_cache.store(query, plan)
             return consolidator_result.final_output_as(ExecutorResponse)
         else:
-            await pq.put(f"- {consolidator.name} failed to returned successfully\n")
+            _report(pq, f"- {consolidator.name} failed to returned successfully\n")
             raise ValueError("The Consolidator did not return a valid response.\n")
         
     @staticmethod
-    async def _orchestrate_tasks(task_plan: TasksPlan, progress_report: asyncio.Queue = None) -> OrchestratorResponse:
+    async def _stream_plan(planner, query: str, task_feed: asyncio.Queue, pq: asyncio.Queue) -> TasksPlan:
         """
-        Pass a plan of tasks to an orchastrator for execution and receive the results of all executed tasks.
+        Run the Planner in streaming mode, pushing each task onto `task_feed` as soon as
+        it is complete in the stream so orchestration overlaps with planning.
+
+        Returns the validated TasksPlan once the stream finishes. The feed is always
+        closed with a None sentinel, even when planning fails.
         """
 
-        # Initialize pq with a throwaway queue if none was provided or use progress_report
-        pq = asyncio.Queue() if progress_report is None else progress_report
+        buffer = ""
+        scan_pos = -1  # position in buffer to resume scanning; -1 until the plan array is found
+        fed: Set[str] = set()
 
-        print(f"Started orchestrate_tasks tool")
-        if task_plan is None:
-            raise ValueError("Cannot orchestrate an empty task plan.")
+        try:
+            # The planner call counts against the global LLM cap for as long as it streams
+            async with _get_llm_sema():
+                result = Runner.run_streamed(planner, f"User Goal: {query}")
+                async for event in result.stream_events():
+                    if event.type != "raw_response_event":
+                        continue
+                    data = getattr(event, 'data', None)
+                    if getattr(data, 'type', '') != 'response.output_text.delta':
+                        continue
+                    buffer += data.delta
+
+                    # Locate the plan array once, then lift out tasks as they complete
+                    if scan_pos < 0:
+                        match = _PLAN_ARRAY_RE.search(buffer)
+                        if match is None:
+                            continue
+                        scan_pos = match.end()
+
+                    objects, scan_pos = _extract_complete_objects(buffer, scan_pos)
+                    for obj in objects:
+                        try:
+                            task = PlannerTask.model_validate_json(obj)
+                        except Exception:
+                            continue  # not a well-formed task; final plan validation still applies
+                        if task.id not in fed:
+                            fed.add(task.id)
+                            await task_feed.put(task)
+
+            if not result.final_output:
+                _report(pq, f" - {planner.name}: failed to produce a plan\n")
+                raise ValueError("Planner agent failed to produce a valid plan.")
+
+            plan = result.final_output_as(TasksPlan)
+
+            # Feed any tasks the incremental scan missed before closing the feed
+            for task in plan.plan:
+                if task.id not in fed:
+                    fed.add(task.id)
+                    await task_feed.put(task)
+            return plan
+        finally:
+            await task_feed.put(None)
 
-        completed = OrchestratorResponse()
-        if len(task_plan.plan) < 1:
-            return completed
+    @staticmethod
+    async def _orchestrate_tasks(task_plan: TasksPlan = None, progress_report: asyncio.Queue = None,
+                                 task_feed: asyncio.Queue = None) -> OrchestratorResponse:
+        """
+        Pass a plan of tasks to an orchastrator for execution and receive the results of all
+        executed tasks. Tasks arrive either as a complete `task_plan` or incrementally on
+        `task_feed` (closed with a None sentinel); either way each task is scheduled as soon
+        as its dependencies are resolved.
+        """
 
-        await pq.put(f"There are {len(task_plan.plan)} tasks in the plan.\n")
-        task_map = {task.id: task for task in task_plan.plan}
-        # running: Set[str] = set()
-        dependents = defaultdict(list)
-        dependency_count = {task.id: len(task.inputs) for task in task_plan.plan}
+        # Initialize pq with a throwaway queue if none was provided or use progress_report
+        pq = asyncio.Queue(maxsize=_PROGRESS_QUEUE_MAXSIZE) if progress_report is None else progress_report
 
-        # Build reverse dependency map
-        for task in task_plan.plan:
-            for dep in task.inputs:
-                dependents[dep].append(task.id)
+        log.debug("Started orchestrate_tasks")
+        if task_plan is None and task_feed is None:
+            raise ValueError("Cannot orchestrate an empty task plan.")
 
-        # Track tasks ready to run (no unresolved dependencies)
-        ready = [task_id for task_id, count in dependency_count.items() if count == 0]
+        completed = OrchestratorResponse()
+        task_map = {}
+        task_inputs = {}  # per-task input ids, frozen as tuples when the task is admitted
+        dependents = {}  # reverse dependency map, populated in the same pass as the counters
+        dependency_count = {}
+        depth_cache = {}
+
+        # Ready tasks, ordered (-downstream depth, task_id) so deepest chains start first;
+        # a fixed pool of worker coroutines pulls from this queue
+        work_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+
+        # Register a task in the dependency graph, counting only unresolved inputs
+        # (a streamed task may arrive after one of its dependencies already completed)
+        def admit(task: PlannerTask) -> bool:
+            task_map[task.id] = task
+            task_inputs[task.id] = tuple(task.inputs)
+            depth_cache.clear()  # new edges can lengthen existing downstream chains
+            unresolved = 0
+            for dep in task_inputs[task.id]:
+                if dep not in completed.tasks_executed:
+                    dependents.setdefault(dep, []).append(task.id)
+                    unresolved += 1
+            dependency_count[task.id] = unresolved
+            return unresolved == 0
+
+        # Longest chain of dependents below a task, over the graph seen so far
+        def downstream_depth(task_id: str) -> int:
+            cached = depth_cache.get(task_id)
+            if cached is not None:
+                return cached
+            depth = 0
+            for dependent in dependents.get(task_id, ()):
+                depth = max(depth, 1 + downstream_depth(dependent))
+            depth_cache[task_id] = depth
+            return depth
+
+        # Queue a task for execution, deepest downstream chain first, so the critical
+        # path starts as early as possible
+        def enqueue_ready(task_id: str):
+            work_queue.put_nowait((-downstream_depth(task_id), task_id))
+
+        if task_plan is not None:
+            if len(task_plan.plan) < 1:
+                return completed
+            _report(pq, f"There are {len(task_plan.plan)} tasks in the plan.\n")
+
+            # Reuse the derived graph for a previously seen plan shape; only the task
+            # bodies (instructions etc.) and the mutable counters are per-run
+            graph_key = _graph_key(task_plan)
+            cached_graph = _GRAPH_CACHE.get(graph_key)
+            if cached_graph is None:
+                seed = [task.id for task in task_plan.plan if admit(task)]
+                if len(_GRAPH_CACHE) >= _GRAPH_CACHE_MAXSIZE:
+                    _GRAPH_CACHE.pop(next(iter(_GRAPH_CACHE)))
+                _GRAPH_CACHE[graph_key] = (
+                    {dep: list(ids) for dep, ids in dependents.items()},
+                    dict(dependency_count),
+                    list(seed)
+                )
+            else:
+                cached_dependents, cached_counts, cached_seed = cached_graph
+                for dep, ids in cached_dependents.items():
+                    dependents[dep] = list(ids)
+                dependency_count.update(cached_counts)
+                for task in task_plan.plan:
+                    task_map[task.id] = task
+                    task_inputs[task.id] = tuple(task.inputs)
+                seed = list(cached_seed)
+            for task_id in seed:
+                enqueue_ready(task_id)
 
         # Executes a single task once its dependencies are resolved.
         async def run_task(task_id: str):
-            await pq.put(f"- running {task_id}\n")
+            _report(pq, f"- running {task_id}\n")
             task = task_map[task_id]
-            resolved_inputs = {dep: completed.tasks_executed[dep] for dep in task.inputs}
-            prompt = (
-                f"Task ID: {task_id}\n\n"
-                f"Task Instructions:\n{task.instructions}\n\n"
-                f"Success Criteria:\n{task.success_criteria}\n\n"
-                f"Inputs:\n{resolved_inputs if resolved_inputs else 'None'}\n\n"
-                f"Notes:\n{task.notes or 'None'}"
-            )
-            result = await PlannerExecutorPattern._assign_task(prompt)
+
+            # Assemble the prompt as a flat list of sections joined once; each resolved
+            # input becomes its own line of raw output text rather than one big repr'd dict
+            parts = [
+                f"Task ID: {task_id}",
+                "",
+                "Task Instructions:", task.instructions,
+                "",
+                "Success Criteria:", task.success_criteria,
+                "",
+                "Inputs:",
+            ]
+            input_ids = task_inputs[task_id]
+            if input_ids:
+                # Pass only each dependency's output text: serializing the whole
+                # TaskOutput re-quoted and escaped the output inside JSON, inflating
+                # the prompt (and its token count) for every long upstream result
+                for dep in input_ids:
+                    dep_result = completed.tasks_executed[dep]
+                    parts.append(f"- {dep}: {dep_result.output or dep_result.errors or 'None'}")
+            else:
+                parts.append("None")
+            parts += ["", "Notes:", task.notes or "None"]
+            prompt = "\n".join(parts)
+            # Tasks whose notes declare non-determinism must not reuse memoized results
+            use_cache = not (task.notes and 'non-deterministic' in task.notes.lower())
+            try:
+                result = await PlannerExecutorPattern._assign_task(prompt, use_cache=use_cache,
+                                                                   progress_report=pq)
+                _report(pq, f"- completed {task_id}\n")
+            except Exception as e:
+                # A failed task must not take down every sibling through the TaskGroup:
+                # record the error so the consolidator can report a partial result, and
+                # let the rest of the DAG keep draining
+                log.exception("Task '%s' failed", task_id)
+                result = TaskOutput(id=task_id, output="", errors=str(e))
+                _report(pq, f"- failed {task_id}: {e}\n")
             completed.tasks_executed[task_id] = result
-            await pq.put(f"- completed {task_id}\n")
 
-            # Mark dependents as potentially ready
-            for dependent in dependents[task_id]:
+            # Mark dependents as potentially ready; dependents of a failed task still
+            # run and see its errors field in their resolved inputs
+            for dependent in dependents.get(task_id, ()):
                 dependency_count[dependent] -= 1
                 if dependency_count[dependent] == 0:
-                    ready.append(dependent)
-
-        # Task execution loop
-        while ready:
-            batch = ready.copy()
-            ready.clear()
-            tasks = [asyncio.create_task(run_task(task_id)) for task_id in batch]
-            for coro in asyncio.as_completed(tasks):
-                await coro
+                    enqueue_ready(dependent)
+
+        # Each pool worker pulls the highest-priority ready task, runs it, and marks it
+        # done; run_task enqueues newly-unblocked dependents before task_done is called,
+        # so work_queue.join() cannot return while reachable tasks remain
+        async def worker_loop():
+            while True:
+                _, task_id = await work_queue.get()
+                try:
+                    await run_task(task_id)
+                finally:
+                    work_queue.task_done()
+
+        # Pull tasks off the feed as the Planner emits them; returns when the feed closes
+        async def consume_feed():
+            while True:
+                task = await task_feed.get()
+                if task is None:
+                    return
+                if admit(task):
+                    enqueue_ready(task.id)
+
+        # A fixed pool of workers consumes the ready queue, so newly-unblocked tasks
+        # start the moment a predecessor finishes and concurrency stays bounded. Task-
+        # level failures are absorbed inside run_task; the TaskGroup only cancels
+        # everything on orchestration bugs.
+        max_workers = int(os.getenv("CONF_MAX_CONCURRENCY", "16"))
+        async with asyncio.TaskGroup() as tg:
+            workers = [tg.create_task(worker_loop()) for _ in range(max_workers)]
+            if task_feed is not None:
+                await consume_feed()
+            await work_queue.join()
+            for worker in workers:
+                worker.cancel()
 
         return completed
-    
+
+    @staticmethod
+    async def _stream_task(worker, task: str, progress_report: asyncio.Queue):
+        """
+        Run the Worker with streaming enabled, reporting heartbeat updates as output
+        text arrives so long tasks show progress before their result materializes.
+        The SDK accumulates the output itself; only a running character count is kept
+        here, so no second copy of a long output is ever built up. Rate-limit errors
+        are retried with the same backoff and jitter as _run_with_retry.
+        """
+
+        for attempt in range(1, _LLM_RETRY_ATTEMPTS + 1):
+            received = 0
+            reported = 0
+            try:
+                async with _get_llm_sema():
+                    result = Runner.run_streamed(worker, input=task)
+                    async for event in result.stream_events():
+                        if event.type != "raw_response_event":
+                            continue
+                        data = event.data
+                        if getattr(data, 'type', '') != 'response.output_text.delta':
+                            continue
+                        received += len(data.delta)
+
+                        # Report in coarse increments so the queue is not flooded per token
+                        if received - reported >= _STREAM_REPORT_CHARS:
+                            reported = received
+                            _report(progress_report, f"  ... {received} characters received\n")
+                return result
+            except RateLimitError:
+                if attempt == _LLM_RETRY_ATTEMPTS:
+                    raise
+                await asyncio.sleep(min(30.0, 2 ** (attempt - 1) + random.random()))
+
     @staticmethod
-    async def _assign_task(task: str, enable_trace: bool = False) -> TaskOutput:
+    async def _assign_task(task: str, enable_trace: bool = False, use_cache: bool = True,
+                           progress_report: asyncio.Queue = None) -> TaskOutput:
         """
         Assigns a single task (in serialized string form) to the Worker agent for execution.
 
         Args:
             task (str): Serialized task prompt including instructions, inputs, and criteria.
             enable_trace (bool): If True, wraps execution in a trace context for observability.
+            use_cache (bool): If True, reuse a memoized result for an identical task prompt.
+            progress_report (asyncio.Queue): Optional queue; when given, the Worker runs
+                in streaming mode and posts heartbeat updates while output arrives.
 
         Returns:
             TaskOutput: Structured result of the task execution.
         """
 
-        # Retrieve or instantiate the Worker agent
-        worker = AgentFactory.get_agent('worker', from_cache=False)
+        # Identical prompts describe identical work, so reuse a memoized result when allowed
+        task_cache = _get_task_cache()
+        cache_key = TaskCache.key_for(task)
+        if use_cache:
+            cached_output = await task_cache.get(cache_key)
+            if cached_output is not None:
+                return cached_output
+
+        # Retrieve the shared Worker agent; its configuration is identical for every task,
+        # so there is no reason to rebuild or even look it up per call
+        worker = _worker_agent()
 
         try:
             # When calling this function standalone, set enable_trace to True
             if enable_trace:
                 with trace(worker.name):
-                    result = await Runner.run(worker, task)
+                    result = await _run_with_retry(worker, task)
+            elif progress_report is not None:
+                result = await PlannerExecutorPattern._stream_task(worker, task, progress_report)
             else:
-                result = await Runner.run(worker, task)
+                result = await _run_with_retry(worker, task)
         except MaxTurnsExceeded as e:
             # The system still returns a result object even when max turns are exceeded
             result = getattr(e, 'result', None)
             if result and result.final_output:
                 return result.final_output_as(TaskOutput)
-            else:
-                try:
-                    task_dict = json.loads(task)
-                    tid = task_dict.id
-                except Exception as json_err:
-                    tid = "task-000"
-                finally:
-                    return TaskOutput(
-                        id=tid,
-                        output="",
-                        errors="Worker exceeded the allowed interaction steps and could not complete the task."
-                    )
 
-        return result.final_output_as(TaskOutput)
+            # The prompt is not JSON, so recover the task id from its known prefix
+            match = _TASK_ID_RE.match(task)
+            return TaskOutput(
+                id=match.group(1) if match else "task-000",
+                output="",
+                errors="Worker exceeded the allowed interaction steps and could not complete the task."
+            )
+
+        task_output = result.final_output_as(TaskOutput)
+        await task_cache.put(cache_key, task_output)
+        return task_output
         
\ No newline at end of file
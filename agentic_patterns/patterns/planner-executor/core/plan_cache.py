@@ -0,0 +1,146 @@
+# plan_cache.py
+# Cache successful TasksPlans keyed by the originating query so repeat queries can skip the Planner call.
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+from schema.planner import TasksPlan
+
+
+class PlanCache:
+    """
+    Stores TasksPlans produced by the Planner, keyed by the query that produced them.
+
+    Lookups first try an exact match on the SHA-256 of the normalized query, then fall
+    back to a semantic match: queries are embedded via the OpenAI embeddings API and
+    compared by cosine similarity against stored embeddings. A hit returns the stored
+    plan so the Planner LLM round-trip is skipped entirely.
+
+    The cache is disabled unless the PLAN_CACHE_ENABLED environment variable is set
+    to a truthy value (see `enabled()`).
+    """
+
+    def __init__(
+        self,
+        db_path: str = './tmp/plan-cache.sqlite3',
+        similarity_threshold: float = 0.90,
+        embedding_model: str = 'text-embedding-3-small'
+    ):
+        self.db_path = Path(db_path)
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self._client = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS plans ("
+                "  key TEXT PRIMARY KEY,"
+                "  query TEXT NOT NULL,"
+                "  embedding TEXT,"
+                "  plan_json TEXT NOT NULL,"
+                "  created REAL NOT NULL"
+                ")"
+            )
+
+    @staticmethod
+    def enabled() -> bool:
+        """Return True when plan caching is switched on via PLAN_CACHE_ENABLED."""
+        return os.getenv('PLAN_CACHE_ENABLED', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    async def lookup(self, query: str) -> Optional[TasksPlan]:
+        """
+        Return a cached TasksPlan for the query, or None on a miss.
+        """
+        key = self._exact_key(query)
+
+        # SQLite work runs via to_thread so connect/query never block the event loop
+        row = await asyncio.to_thread(self._fetch_exact, key)
+        if row:
+            return TasksPlan.model_validate_json(row[0])
+
+        # No exact match -- try a semantic match over stored query embeddings
+        embedding = await self._embed(query)
+        if embedding is None:
+            return None
+
+        rows = await asyncio.to_thread(self._fetch_embedded)
+
+        best_score, best_plan_json = 0.0, None
+        for stored_embedding, plan_json in rows:
+            score = self._cosine(embedding, json.loads(stored_embedding))
+            if score > best_score:
+                best_score, best_plan_json = score, plan_json
+
+        if best_plan_json is not None and best_score >= self.similarity_threshold:
+            return TasksPlan.model_validate_json(best_plan_json)
+        return None
+
+    async def store(self, query: str, plan: TasksPlan):
+        """
+        Store a plan that led to a successful run, keyed by its query.
+        """
+        embedding = await self._embed(query)
+        await asyncio.to_thread(self._insert, query, embedding, plan)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _fetch_exact(self, key: str):
+        with self._connect() as conn:
+            return conn.execute("SELECT plan_json FROM plans WHERE key = ?", (key,)).fetchone()
+
+    def _fetch_embedded(self) -> list:
+        with self._connect() as conn:
+            return conn.execute("SELECT embedding, plan_json FROM plans WHERE embedding IS NOT NULL").fetchall()
+
+    def _insert(self, query: str, embedding: Optional[list], plan: TasksPlan):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO plans (key, query, embedding, plan_json, created) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._exact_key(query),
+                    query,
+                    json.dumps(embedding) if embedding is not None else None,
+                    plan.model_dump_json(),
+                    time.time()
+                )
+            )
+
+    async def _embed(self, query: str) -> Optional[list]:
+        """Embed the normalized query, returning None if the embeddings API is unavailable."""
+        try:
+            if self._client is None:
+                self._client = AsyncOpenAI()
+            response = await self._client.embeddings.create(
+                model=self.embedding_model,
+                input=self._normalize(query)
+            )
+            return response.data[0].embedding
+        except Exception:
+            # Fall back to exact-match-only behavior when embeddings cannot be computed
+            return None
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return re.sub(r'\s+', ' ', query).strip().lower()
+
+    @classmethod
+    def _exact_key(cls, query: str) -> str:
+        return hashlib.sha256(cls._normalize(query).encode()).hexdigest()
+
+    @staticmethod
+    def _cosine(a: list, b: list) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
@@ -21,6 +21,11 @@ class Registry:
         self._registry[key] = item
 
     def get(self, key: str) -> Any:
+        """Return the item registered under `key`, or None when there is no entry."""
+        return self._registry.get(key)
+
+    def require(self, key: str) -> Any:
+        """Return the item registered under `key`, raising KeyError when it is missing."""
         if key not in self._registry:
             raise KeyError(f"{self.name} registry has no entry for key: '{key}'")
         return self._registry[key]
@@ -32,7 +37,7 @@ class Registry:
         return key in self._registry
 
     def __getitem__(self, key: str) -> Any:
-        return self.get(key)
+        return self.require(key)
 
     def __repr__(self):
         return f"<Registry '{self.name}' with {len(self._registry)} items>"
@@ -0,0 +1,78 @@
+# task_cache.py
+# Memoize Worker task results so identical task prompts skip the LLM round-trip.
+
+import asyncio
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from schema.orchestrator import TaskOutput
+
+
+class TaskCache:
+    """
+    Caches TaskOutputs keyed by the SHA-256 of the serialized task prompt.
+
+    A task prompt captures the instructions, success criteria, resolved inputs,
+    and notes of a task, so two identical prompts describe the same work and can
+    share a result. Entries expire after `ttl_seconds` (7 days by default).
+    """
+
+    def __init__(self, db_path: str = './tmp/task-cache.sqlite3', ttl_seconds: float = 7 * 24 * 3600):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS task_outputs ("
+                "  key TEXT PRIMARY KEY,"
+                "  output_json TEXT NOT NULL,"
+                "  created REAL NOT NULL"
+                ")"
+            )
+
+    @staticmethod
+    def key_for(task: str) -> str:
+        """Return the cache key for a serialized task prompt."""
+        return hashlib.sha256(task.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[TaskOutput]:
+        """Return the cached TaskOutput for a key, or None on a miss or expired entry."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, output: TaskOutput):
+        """Store a task result. Writes are atomic via the SQLite transaction."""
+        await asyncio.to_thread(self._put, key, output)
+
+    # The sync bodies below run via to_thread so connect/query/commit never block
+    # the event loop under concurrent task execution
+
+    def _get(self, key: str) -> Optional[TaskOutput]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT output_json, created FROM task_outputs WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        output_json, created = row
+        if time.time() - created > self.ttl_seconds:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM task_outputs WHERE key = ?", (key,))
+            return None
+
+        return TaskOutput.model_validate_json(output_json)
+
+    def _put(self, key: str, output: TaskOutput):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO task_outputs (key, output_json, created) VALUES (?, ?, ?)",
+                (key, output.model_dump_json(), time.time())
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
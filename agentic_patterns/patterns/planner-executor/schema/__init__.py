@@ -0,0 +1,13 @@
+# __init__.py
+# Pre-compiles the validators and JSON schemas for the models exchanged with the LLM
+# on every round-trip, so the first task does not pay the one-time generation cost.
+
+from schema.executor import ExecutorResponse
+from schema.orchestrator import OrchestratorResponse, TaskOutput
+from schema.planner import PlannerTask, TasksPlan
+
+# Cached JSON schema dicts; reuse these instead of re-deriving with model_json_schema()
+TASK_OUTPUT_SCHEMA = TaskOutput.model_json_schema()
+PLANNER_TASK_SCHEMA = PlannerTask.model_json_schema()
+TASKS_PLAN_SCHEMA = TasksPlan.model_json_schema()
+EXECUTOR_RESPONSE_SCHEMA = ExecutorResponse.model_json_schema()
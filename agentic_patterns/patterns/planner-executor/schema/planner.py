@@ -10,6 +10,9 @@ from core.registries import output_type_registry
 class PlannerTask(BaseModel):
     """Represents a single atomic task produced by the Planner."""
 
+    # The pattern= constraint stays on the Field: pydantic v2 compiles it once per
+    # class in Rust, and it is published in the JSON schema the structured-output
+    # API uses to constrain the Planner, which a Python validator would not be
     id: str = Field(..., pattern=r'^task-\d{3}$', description="Unique, sequential task ID (e.g., task-001, task-002)")
     instructions: str = Field(..., description="Specific instruction to be passed to an Executor.")
     success_criteria: str = Field(..., description="An objective condition or check that defines what it means for this task to be successfully completed.")
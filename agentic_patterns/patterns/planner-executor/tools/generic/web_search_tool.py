@@ -1,19 +1,31 @@
 # web_search_tool.py
 # A generic tool that performs real-time web searches using the Serper.dev API.
 
-import json
+import httpx
 import os
-import requests
 from agents import function_tool
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 from core.registries import tool_registry
 
 
+# Shared async client, created lazily on first search. Reusing one client keeps the
+# connection pool warm so concurrent workers do not pay a TCP+TLS handshake per query,
+# and the async request never blocks the event loop the way requests.post would.
+_client: httpx.AsyncClient = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(limits=httpx.Limits(max_connections=32))
+    return _client
+
+
 @function_tool
-def web_search_tool(
-    query: str, 
-    timeout: int = 10, 
+async def web_search_tool(
+    query: str,
+    timeout: int = 10,
     url: str = "https://google.serper.dev/search") -> Dict[str, Any]:
     """
     Performs a web search using the Serper.dev API and returns the parsed JSON response.
@@ -25,7 +37,7 @@ def web_search_tool(
 
     Raises:
         EnvironmentError: If the SERPER_API_KEY environment variable is not set.
-        requests.RequestException: If the HTTP request fails or times out.
+        httpx.HTTPError: If the HTTP request fails or times out.
 
     Returns:
         Dict[str, Any]: A dictionary containing the JSON response from the API.
@@ -43,12 +55,11 @@ def web_search_tool(
 
     payload = {"q": query}
 
-    # Post request to serper
-    with requests.Session() as session:
-        response = session.post(url, headers=headers, json=payload, timeout=timeout)
-        response.raise_for_status()
-        return response.json()        
+    # Post request to serper over the shared connection pool
+    response = await _get_client().post(url, headers=headers, json=payload, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 # Register this tool
-tool_registry.register(web_search_tool.name, web_search_tool)
\ No newline at end of file
+tool_registry.register(web_search_tool.name, web_search_tool)
@@ -0,0 +1,171 @@
+# ui.py
+# Gradio front end for the Planner–Executor pattern; main.py stays UI-free so the
+# pattern can be used programmatically without importing gradio.
+
+import asyncio
+import gradio as gr
+import json
+import os
+import threading
+import time
+
+from core.agent_factory import AgentFactory
+from core.env import load_environment
+from main import run
+from schema.executor import ExecutorResponse
+
+
+async def wrapped_run(query: str):
+    """
+    Wrap the run function to handle the UI updates.
+    """
+
+    # Update to show 'running' state and disable the button
+    latest_update: str = "⏳ Working..."
+    yield (
+        gr.Button(value="Running...", interactive=False, variant="primary"),    # run_button
+        gr.Markdown(label="Work Product", value=""),                            # report
+        gr.Markdown(label="Progress", value=latest_update)                # progress
+    )
+
+    # Buffer of progress messages; joined only when a UI update is actually yielded,
+    # so the log grows linearly instead of re-concatenating the whole string per tick
+    progress_log: list[str] = []
+    result: ExecutorResponse = None
+
+    # Handle progress updates for display in the UI; the last item is the response.
+    # Closing the stream on early exit (disconnect, shutdown) cancels the pattern run.
+    stream = run(query)
+    try:
+        async for item in stream:
+            if isinstance(item, ExecutorResponse):
+                result = item
+                break
+
+            progress_log.append(item)
+            yield (
+                gr.Button(value="Running...", interactive=False, variant="primary"),
+                gr.Markdown(label="Work Product", value=""),
+                gr.Markdown(label="Progress", value="\n".join(progress_log))
+            )
+    finally:
+        await stream.aclose()
+
+    # Return the final response
+    def get_final_status() -> str:
+        status_line = "**Status:**"
+
+        # Scan the buffered chunks in reverse; rfind locates the last status entry
+        # even mid-chunk, without joining the whole log into one string first
+        for i in range(len(progress_log) - 1, -1, -1):
+            idx = progress_log[i].rfind(status_line)
+            if idx != -1:
+                return "\n".join([progress_log[i][idx:]] + progress_log[i + 1:])
+
+        # If no status line was found, return only the last chunk
+        return progress_log[-1] if progress_log else ""
+
+    if result is not None and result.final_output:
+        work_output = result.final_output
+    elif progress_log:
+        # Mirrors the old behavior: surface the last status/error message instead
+        work_output = progress_log[-1]
+    else:
+        work_output = "PATTERN FAILED TO RUN"
+
+    final_update = get_final_status()
+    yield (
+        gr.Button(value="Run", interactive=True, variant="primary"),
+        gr.Markdown(label="Work Product", value=work_output),
+        gr.Markdown(label="Progress", value=final_update)
+    )
+
+def on_exit():
+    """
+    Called by the exit button
+    """
+
+    # Update UI and disable controls
+    yield(
+        gr.Dropdown(label="Use a Sample Query: (optional)", interactive=False),
+        gr.Textbox(label="Describe the task that you would like to have completed:", lines=6, interactive=False),
+        gr.Button(value="Run", interactive=False, variant="primary"),
+        gr.Button(value="Server Ended", interactive=False, variant="secondary")
+    )
+
+    # Initiate threaded exit
+    def threaded_exit():
+        # Wait a moment to allow Gradio to process the click event
+        time.sleep(0.5)
+
+        # Gracefully shut down the application
+        os._exit(0)
+
+    threading.Thread(target=threaded_exit).start()
+
+
+async def main():
+    # Read settings off the event-loop thread, then pre-build all three agents
+    # concurrently so the first query does not pay for their construction
+    await asyncio.to_thread(load_environment)
+    await AgentFactory.warmup()
+
+    # Sample queries live in samples.json so importing this module stays lean;
+    # they are only needed once the dropdown below is built
+    samples_path = os.path.join(os.path.dirname(__file__), "samples.json")
+    with open(samples_path, encoding="utf-8") as f:
+        test_query = json.load(f)
+
+    with gr.Blocks(theme=gr.themes.Default(primary_hue="sky")) as ui:
+        gr.Markdown("# **Planner-Executor** | Agentic Pattern")
+        with gr.Row():
+            with gr.Column(scale=6):
+
+                # Dropdown for loading sample queries
+                sample_selector = gr.Dropdown(
+                    label="Use a Sample Query: (Optional)",
+                    choices=test_query,
+                    value=None,
+                    interactive=True
+                )
+
+                # Textbox for user to write the query
+                query_textbox = gr.Textbox(
+                    label="Describe the task that you would like to have completed:",
+                    lines=6,
+                    interactive=True,
+                )
+
+                # Display stream of progress updates
+                progress_output = gr.Markdown(label="Progress")
+
+                # Final output goes here
+                report = gr.Markdown(label="Work Product")
+            with gr.Column(scale=1, min_width=160):
+                run_button = gr.Button("Run", variant="primary")
+                exit_button = gr.Button("Shutdown Server", variant="stop")
+
+        # Connect the events
+        sample_selector.change(fn=lambda q: gr.Textbox(value=q), inputs=sample_selector, outputs=query_textbox)
+        run_button.click(fn=wrapped_run, inputs=query_textbox, outputs=[run_button, report, progress_output])
+        exit_button.click(fn=on_exit, inputs=None, outputs=[sample_selector, query_textbox, run_button, exit_button])
+
+    try:
+        ui.launch(inbrowser=True, share=False)
+    except Exception as e:
+        print(f"An error occurred: {e}. Shutting down Gradio server...")
+    finally:
+        ui.close()
+        print("Gradio server is shut down.")
+
+
+if __name__ == "__main__":
+    # Prefer uvloop's libuv-based event loop when installed (POSIX only); the
+    # default loop is the silent fallback everywhere else
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main())